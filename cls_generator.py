@@ -31,11 +31,69 @@ Usage:
     generator.save("my_palette.cls")
 """
 
+import collections.abc
+import mmap
 import struct
-from typing import List, Tuple
+import sys
+from typing import List, Sequence, Tuple
+
+# Precompiled little-endian layouts used by the .cls format
+_HDR_U16 = struct.Struct('<H')
+_COLOR_STRUCT = struct.Struct('<IBBBBI')  # block length, RGBA, trailing zero
+_PREFIX = struct.Struct('<4sHI')  # signature, version marker, header length
+_NAME_SEP = struct.Struct('<IH')  # zero padding, UTF-8 name length
+_COLORS_HDR = struct.Struct('<III')  # channels, color count, colors data length
+_RGBA = struct.Struct('4B')
+
+def _clamp_bytes(channels: List[int]) -> bytes:
+    """Pack channel values into bytes, clamping each to 0-255"""
+    try:
+        # Fast path: every channel is already in range
+        return bytes(channels)
+    except ValueError:
+        return bytes(0 if x < 0 else (255 if x > 255 else x) for x in channels)
+
+def _pack_colors(rgba, out: bytearray, offset: int):
+    """
+    Write the 12-byte color blocks for packed RGBA bytes into a zero-filled buffer
+    
+    Each block is (int32 block length 8, RGBA, int32 trailing zero). Only the
+    low byte of the block length and the four channels are stored, one
+    strided copy per field, so no Python-level loop runs per color.
+    
+    Args:
+        rgba: Packed RGBA bytes, 4 per color
+        out: Zero-filled destination buffer
+        offset: Position of the first color block in out
+    """
+    color_count = len(rgba) // 4
+    if not color_count:
+        return
+    out[offset:offset + color_count * 12:12] = b'\x08' * color_count
+    for channel in range(4):
+        out[offset + 4 + channel:offset + color_count * 12:12] = rgba[channel::4]
+
+def _unpack_colors(raw) -> bytearray:
+    """
+    Extract packed RGBA bytes from consecutive 12-byte color blocks
+    
+    Args:
+        raw: Color blocks as stored in a .cls file
+    
+    Returns:
+        Packed RGBA bytes, 4 per color
+    """
+    color_count = len(raw) // 12
+    rgba = bytearray(color_count * 4)
+    if color_count:
+        for channel in range(4):
+            rgba[channel::4] = raw[4 + channel::12]
+    return rgba
 
 class CLSColor:
     """Represents a single color in RGBA format"""
+    __slots__ = ('r', 'g', 'b', 'a')
+    
     def __init__(self, r: int, g: int, b: int, a: int = 255):
         """
         Create a color. Alpha should be either 0 (transparent) or 255 (opaque).
@@ -47,10 +105,10 @@ class CLSColor:
             b: Blue (0-255)
             a: Alpha (0 or 255, default 255)
         """
-        self.r = max(0, min(255, r))
-        self.g = max(0, min(255, g))
-        self.b = max(0, min(255, b))
-        self.a = max(0, min(255, a))
+        self.r = 0 if r < 0 else (255 if r > 255 else r)
+        self.g = 0 if g < 0 else (255 if g > 255 else g)
+        self.b = 0 if b < 0 else (255 if b > 255 else b)
+        self.a = 0 if a < 0 else (255 if a > 255 else a)
     
     def __repr__(self):
         return f"CLSColor(R:{self.r}, G:{self.g}, B:{self.b}, A:{self.a})"
@@ -59,6 +117,48 @@ class CLSColor:
         """Return hex representation"""
         return f"#{self.r:02X}{self.g:02X}{self.b:02X}"
 
+class _CLSColorsView(collections.abc.Sequence):
+    """Read-only sequence of CLSColor copies over a generator's packed colors"""
+    __slots__ = ('_generator',)
+    
+    def __init__(self, generator: 'CLSGenerator'):
+        self._generator = generator
+    
+    def __len__(self):
+        return self._generator._color_count()
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("color index out of range")
+        return CLSColor(*_RGBA.unpack_from(self._generator._rgba, index * 4))
+    
+    def __iter__(self):
+        for r, g, b, a in _RGBA.iter_unpack(self._generator._rgba):
+            yield CLSColor(r, g, b, a)
+    
+    def __eq__(self, other):
+        # Compares by channel values, against another view or any sequence of CLSColor
+        if isinstance(other, _CLSColorsView):
+            return self._generator._rgba == other._generator._rgba
+        if not isinstance(other, collections.abc.Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        return all(
+            isinstance(color, CLSColor) and (color.r, color.g, color.b, color.a) == channels
+            for color, channels in zip(other, _RGBA.iter_unpack(self._generator._rgba))
+        )
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"[{', '.join(map(repr, self))}]"
+
 class CLSGenerator:
     """Generate .cls files for Clip Studio Paint"""
     
@@ -70,7 +170,44 @@ class CLSGenerator:
             name: Name of the color set (will appear in CSP)
         """
         self.name = name
-        self.colors: List[CLSColor] = []
+        # Colors are stored packed as consecutive RGBA bytes, 4 per color
+        self._rgba = bytearray()
+    
+    @property
+    def name(self) -> str:
+        """Name of the color set"""
+        return self._name
+    
+    @name.setter
+    def name(self, value: str):
+        # Encoded once here so repeated saves don't re-encode the name
+        self._name = value
+        try:
+            # Pure ASCII names encode identically in both forms
+            self._utf8_name = self._ascii_name = value.encode('ascii')
+        except UnicodeEncodeError:
+            self._ascii_name = value.encode('ascii', errors='replace')
+            self._utf8_name = value.encode('utf-8')
+    
+    def _color_count(self) -> int:
+        return len(self._rgba) // 4
+    
+    @property
+    def colors(self) -> Sequence[CLSColor]:
+        """
+        Read-only view of the palette as CLSColor objects
+        
+        Colors are stored packed, so each item is a fresh CLSColor copy:
+        changing its attributes does not affect the palette. Use add_color()
+        and friends to add colors, or assign a list of CLSColor objects to
+        replace them all. The view compares equal to another palette's view
+        or to a list of CLSColor objects with the same channel values.
+        """
+        return _CLSColorsView(self)
+    
+    @colors.setter
+    def colors(self, colors: List[CLSColor]):
+        self._rgba = bytearray(_clamp_bytes([x for c in colors for x in (c.r, c.g, c.b, c.a)]))
     
     def add_color(self, r: int, g: int, b: int, a: int = 255):
         """
@@ -82,8 +219,12 @@ class CLSGenerator:
             b: Blue (0-255)
             a: Alpha (0 or 255, default 255)
         """
-        color = CLSColor(r, g, b, a)
-        self.colors.append(color)
+        self._rgba += bytes((
+            0 if r < 0 else (255 if r > 255 else r),
+            0 if g < 0 else (255 if g > 255 else g),
+            0 if b < 0 else (255 if b > 255 else b),
+            0 if a < 0 else (255 if a > 255 else a),
+        ))
         return self
     
     def add_color_from_hex(self, hex_color: str, a: int = 255):
@@ -94,18 +235,13 @@ class CLSGenerator:
             hex_color: Hex color like "#FF0000" or "FF0000"
             a: Alpha (0 or 255, default 255)
         """
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) == 6:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            self.add_color(r, g, b, a)
-        elif len(hex_color) == 8:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            a = int(hex_color[6:8], 16)
-            self.add_color(r, g, b, a)
+        buf = bytes.fromhex(hex_color.lstrip('#'))
+        if len(buf) == 3:
+            self.add_color(buf[0], buf[1], buf[2], a)
+        elif len(buf) == 4:
+            self.add_color(buf[0], buf[1], buf[2], buf[3])
+        else:
+            raise ValueError(f"Invalid hex color: {hex_color!r} (expected RRGGBB or RRGGBBAA)")
         return self
     
     def add_colors_from_list(self, colors: List[Tuple[int, int, int]]):
@@ -115,15 +251,99 @@ class CLSGenerator:
         Args:
             colors: List of (R, G, B) tuples
         """
-        for r, g, b in colors:
-            self.add_color(r, g, b)
+        self._rgba += _clamp_bytes([x for r, g, b in colors for x in (r, g, b, 255)])
+        return self
+    
+    def add_colors_rgba(self, colors):
+        """
+        Add multiple RGBA colors at once
+        
+        Args:
+            colors: List of (R, G, B, A) tuples, or an object supporting the
+                    buffer protocol that is either flat or shaped (N, 4),
+                    such as bytes, array.array or a NumPy array. Unsigned
+                    byte data is appended as-is; any other integer data is
+                    clamped to 0-255.
+        """
+        try:
+            data = memoryview(colors)
+        except TypeError:
+            data = None
+        if data is not None:
+            with data:
+                if data.ndim > 1 and data.shape[-1] != 4:
+                    raise ValueError("RGBA data must have 4 channels per color")
+                if data.nbytes // data.itemsize % 4:
+                    raise ValueError("RGBA data length must be a multiple of 4")
+                if data.format in ('B', 'c'):
+                    self._rgba += data.cast('B') if data.c_contiguous else data.tobytes()
+                    return self
+                channels = data.tolist()
+                for _ in range(data.ndim - 1):
+                    channels = [x for row in channels for x in row]
+            self._rgba += _clamp_bytes(channels)
+            return self
+        
+        self._rgba += _clamp_bytes([x for r, g, b, a in colors for x in (r, g, b, a)])
         return self
     
     def clear(self):
         """Remove all colors"""
-        self.colors = []
+        self._rgba = bytearray()
         return self
     
+    def _header_length(self) -> int:
+        """Length of the name header that follows the signature"""
+        return (
+            2 +                        # length of ASCII name field (int16)
+            len(self._ascii_name) +    # ASCII name
+            4 +                        # zero padding (int32)
+            2 +                        # length of UTF-8 name field (int16)
+            len(self._utf8_name)       # UTF-8 name
+        )
+    
+    def _file_size(self) -> int:
+        """Total size in bytes of the .cls file for this color set"""
+        return (
+            _PREFIX.size + self._header_length() + _COLORS_HDR.size +
+            self._color_count() * _COLOR_STRUCT.size    # Each color is 12 bytes
+        )
+    
+    def _pack_into(self, buf):
+        """
+        Write the complete .cls file into a zero-filled writable buffer
+        
+        Args:
+            buf: Buffer of at least _file_size() bytes, such as a bytearray or mmap
+        """
+        ascii_name = self._ascii_name
+        utf8_name = self._utf8_name
+        header_length = self._header_length()
+        color_count = self._color_count()
+        colors_data_length = color_count * _COLOR_STRUCT.size
+        colors_offset = _PREFIX.size + header_length + _COLORS_HDR.size
+        
+        with memoryview(buf) as mv:
+            # Signature, version marker (int16) and header length (int32)
+            offset = 0
+            _PREFIX.pack_into(buf, offset, b'SLCC', 256, header_length)
+            offset += _PREFIX.size
+            
+            # Header: names with their int16 lengths and an int32 zero between them
+            _HDR_U16.pack_into(buf, offset, len(ascii_name))
+            offset += _HDR_U16.size
+            mv[offset:offset + len(ascii_name)] = ascii_name
+            offset += len(ascii_name)
+            _NAME_SEP.pack_into(buf, offset, 0, len(utf8_name))
+            offset += _NAME_SEP.size
+            mv[offset:offset + len(utf8_name)] = utf8_name
+            offset += len(utf8_name)
+        
+        # Colors section header: channels, color count, data length (int32 each)
+        _COLORS_HDR.pack_into(buf, offset, 4, color_count, colors_data_length)
+        
+        _pack_colors(self._rgba, buf, colors_offset)
+    
     def save(self, filename: str):
         """
         Save the color set to a .cls file
@@ -131,64 +351,60 @@ class CLSGenerator:
         Args:
             filename: Output filename (should end with .cls)
         """
+        # Lay out the whole file in one preallocated buffer
+        buf = bytearray(self._file_size())
+        self._pack_into(buf)
+        
         with open(filename, 'wb') as f:
-            # Write signature
-            f.write(b'SLCC')
-            f.write(struct.pack('<H', 256))  # int16, version marker
-            
-            # Prepare name strings
-            ascii_name = self.name.encode('ascii', errors='replace')
-            utf8_name = self.name.encode('utf-8')
-            
-            # Calculate header length
-            header_length = (
-                2 +                    # length of ASCII name field (int16)
-                len(ascii_name) +      # ASCII name
-                4 +                    # zero padding (int32)
-                2 +                    # length of UTF-8 name field (int16)
-                len(utf8_name)         # UTF-8 name
-            )
-            
-            # Write header
-            f.write(struct.pack('<I', header_length))  # int32
-            f.write(struct.pack('<H', len(ascii_name)))  # int16
-            f.write(ascii_name)
-            f.write(struct.pack('<I', 0))  # int32 zero
-            f.write(struct.pack('<H', len(utf8_name)))  # int16
-            f.write(utf8_name)
-            
-            # Write colors section header
-            f.write(struct.pack('<I', 4))  # int32, number of channels
-            f.write(struct.pack('<I', len(self.colors)))  # int32, color count
-            
-            # Calculate colors data length
-            colors_data_length = len(self.colors) * 12  # Each color is 12 bytes
-            f.write(struct.pack('<I', colors_data_length))  # int32
-            
-            # Write each color
-            for color in self.colors:
-                f.write(struct.pack('<I', 8))  # int32, length of this color block
-                f.write(struct.pack('BBBB', color.r, color.g, color.b, color.a))  # RGBA
-                f.write(struct.pack('<I', 0))  # int32 trailing zero
+            f.write(buf)
         
-        print(f"✓ Saved {len(self.colors)} colors to: {filename}")
+        print(f"✓ Saved {self._color_count()} colors to: {filename}")
+        return filename
+    
+    def save_mmap(self, filename: str):
+        """
+        Save the color set to a .cls file through a memory map
+        
+        Produces the same file as save(), but writes straight into the page
+        cache instead of building the file in memory first. Useful for very
+        large palettes.
+        
+        Args:
+            filename: Output filename (should end with .cls)
+        """
+        size = self._file_size()
+        with open(filename, 'wb+') as f:
+            f.truncate(size)
+            with mmap.mmap(f.fileno(), size) as mm:
+                self._pack_into(mm)
+                mm.flush()
+        
+        print(f"✓ Saved {self._color_count()} colors to: {filename}")
         return filename
     
     def print_preview(self):
         """Print a preview of all colors"""
         print(f"\n{'='*60}")
         print(f"Color Set: {self.name}")
-        print(f"Total Colors: {len(self.colors)}")
+        print(f"Total Colors: {self._color_count()}")
         print(f"{'='*60}\n")
         
-        for i, color in enumerate(self.colors, 1):
-            hex_code = color.to_hex()
-            bar = '█' * 5
-            print(f"{i:>3}. {hex_code} RGB({color.r:3}, {color.g:3}, {color.b:3}) {bar}")
+        lines = [
+            f"{i:>3}. #{r:02X}{g:02X}{b:02X} RGB({r:3}, {g:3}, {b:3}) █████\n"
+            for i, (r, g, b, _) in enumerate(_RGBA.iter_unpack(self._rgba), 1)
+        ]
+        sys.stdout.write(''.join(lines))
         
         print(f"\n{'='*60}\n")
 
 
+def _read_exact(f, size: int) -> bytes:
+    """Read exactly size bytes of the .cls header, or raise ValueError"""
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Invalid .cls file: truncated header")
+    return data
+
 def load_cls(filename: str) -> 'CLSGenerator':
     """
     Load a .cls file and return a CLSGenerator object
@@ -205,39 +421,37 @@ def load_cls(filename: str) -> 'CLSGenerator':
         if sig != b'SLCC':
             raise ValueError("Invalid .cls file: wrong signature")
         
-        version = struct.unpack('<H', f.read(2))[0]
+        version = int.from_bytes(_read_exact(f, 2), 'little')
         
         # Read header
-        header_length = struct.unpack('<I', f.read(4))[0]
+        header_length = int.from_bytes(_read_exact(f, 4), 'little')
         
         # Read ASCII name
-        ascii_name_len = struct.unpack('<H', f.read(2))[0]
-        ascii_name = f.read(ascii_name_len).decode('ascii', errors='replace')
+        ascii_name_len = int.from_bytes(_read_exact(f, 2), 'little')
+        ascii_name = _read_exact(f, ascii_name_len).decode('ascii', errors='replace')
         
         # Skip zero padding
-        f.read(4)
+        _read_exact(f, 4)
         
         # Read UTF-8 name
-        utf8_name_len = struct.unpack('<H', f.read(2))[0]
-        utf8_name = f.read(utf8_name_len).decode('utf-8', errors='replace')
+        utf8_name_len = int.from_bytes(_read_exact(f, 2), 'little')
+        utf8_name = _read_exact(f, utf8_name_len).decode('utf-8', errors='replace')
         
         # Use UTF-8 name (CSP prefers this)
         generator = CLSGenerator(utf8_name or ascii_name)
         
         # Read colors section
-        channels = struct.unpack('<I', f.read(4))[0]
-        color_count = struct.unpack('<I', f.read(4))[0]
-        colors_data_len = struct.unpack('<I', f.read(4))[0]
+        channels = int.from_bytes(_read_exact(f, 4), 'little')
+        color_count = int.from_bytes(_read_exact(f, 4), 'little')
+        colors_data_len = int.from_bytes(_read_exact(f, 4), 'little')
         
-        # Read each color
-        for _ in range(color_count):
-            block_len = struct.unpack('<I', f.read(4))[0]
-            r, g, b, a = struct.unpack('BBBB', f.read(4))
-            trailing_zero = struct.unpack('<I', f.read(4))[0]
-            
-            generator.add_color(r, g, b, a)
+        # Read all color blocks at once
+        raw = f.read(color_count * _COLOR_STRUCT.size)
+        if len(raw) != color_count * _COLOR_STRUCT.size:
+            raise ValueError("Invalid .cls file: truncated color data")
+        generator._rgba = _unpack_colors(raw)
     
-    print(f"✓ Loaded {len(generator.colors)} colors from: {filename}")
+    print(f"✓ Loaded {generator._color_count()} colors from: {filename}")
     return generator
 
 